@@ -1,11 +1,101 @@
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 import pandas as pd
 import numpy as np
 import json
+import logging
+import mmap
 import os
+import re
 
+# JSON backends in order of preference; json is the stdlib fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-def save_output_in_json(output_file_path, data, data_description=''):
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pacsv
+except ImportError:
+    pa = None
+
+logger = logging.getLogger(__name__)
+
+# Userspace buffer for bulk writes, so large payloads go out in few write() calls
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# Size of the slices large files are scanned and copied in, bounding memory use
+_CHUNK_SIZE = 1 << 24
+
+# A run of digits long enough to be an integer outside the 64-bit range orjson decodes exactly
+_WIDE_INTEGER = re.compile(rb'\d{19,}')
+
+# File extensions pyarrow.csv.read_csv infers a compression codec from
+_COMPRESSED_SUFFIXES = ('.bz2', '.gz', '.lz4', '.zst')
+
+# The strings pd.read_csv treats as missing values by default
+_CSV_NULL_VALUES = [
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND', '1.#QNAN',
+    '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null',
+]
+
+
+def _dumps_json(obj, pretty=False):
+    """
+    Serializes obj to UTF-8 JSON bytes with the fastest available backend.
+
+    Output is compact by default, or indented by 2 spaces with sorted keys if pretty.
+    """
+    if orjson is not None:
+        # orjson serializes straight to UTF-8 bytes and handles numpy/datetime natively
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS
+        try:
+            return orjson.dumps(obj, option=option)
+        except orjson.JSONEncodeError:
+            # e.g. integers wider than 64 bits, which ujson and the stdlib encoder still handle
+            pass
+
+    indent = 2 if pretty else None
+    if ujson is not None:
+        return ujson.dumps(
+            obj,
+            ensure_ascii=False,
+            escape_forward_slashes=False,
+            indent=indent or 0,
+            sort_keys=pretty,
+        ).encode('utf8')
+
+    separators = None if pretty else (',', ':')
+    return json.dumps(
+        obj, ensure_ascii=False, indent=indent, separators=separators, sort_keys=pretty
+    ).encode('utf8')
+
+
+def _loads_json(raw):
+    """
+    Parses JSON bytes with the fastest available backend.
+
+    Raises json.JSONDecodeError for invalid JSON whichever backend is used.
+    """
+    # orjson decodes integers outside the 64-bit range as floats, so leave those to the others
+    if orjson is not None and not _WIDE_INTEGER.search(raw):
+        return orjson.loads(raw)
+    if ujson is not None:
+        try:
+            return ujson.loads(raw)
+        except ValueError as exc:
+            raise json.JSONDecodeError(str(exc), raw.decode('utf8', 'replace'), 0) from None
+    return json.loads(raw)
+
+
+def save_output_in_json(output_file_path, data, data_description='', pretty=False):
     """
     Saves data to a JSON file.
 
@@ -13,6 +103,12 @@ def save_output_in_json(output_file_path, data, data_description=''):
         output_file_path (str): The path to the output JSON file.
         data (any): The data to be saved in the JSON file.
         data_description (str, optional): A description or key for the data (default: '').
+        pretty (bool, optional): Whether to indent and sort keys for human-readable output
+            (default: False).
+
+    When orjson is installed, NaN and infinite floats are written as null (the stdlib writes
+    NaN/Infinity, which is not valid JSON). Data orjson cannot encode, such as integers wider
+    than 64 bits, is written with ujson or the stdlib encoder instead.
 
     Returns:
         None
@@ -29,16 +125,16 @@ def save_output_in_json(output_file_path, data, data_description=''):
     if not output_file_path:
         raise ValueError("Output file path is required.")
 
+    key = data_description if data_description != '' else 'data'
+
     try:
-        with open(output_file_path, 'w', encoding='utf8') as json_file:
-            indent = 4  # Set the indentation level (optional)
-            if data_description != '':
-                json.dump({data_description: data}, json_file, ensure_ascii=False, indent=indent, sort_keys=True)
-            else:
-                json.dump({'data': data}, json_file, ensure_ascii=False, indent=indent, sort_keys=True)
-        print(f"JSON file '{output_file_path}' saved successfully!\n")
+        # Serialize up front and write once, rather than a write() per token
+        payload = _dumps_json({key: data}, pretty=pretty)
+        with open(output_file_path, 'wb', buffering=_WRITE_BUFFER_SIZE) as json_file:
+            json_file.write(payload)
+        logger.debug("JSON file '%s' saved successfully!", output_file_path)
     except Exception as exc:
-        print(f"!! Failed to save JSON file '{output_file_path}'. !!\n", exc)
+        logger.error("Failed to save JSON file '%s': %s", output_file_path, exc)
 
 
 
@@ -60,24 +156,99 @@ def load_json_file(file_path):
         file_path = 'data.json'
         data = load_json_file(file_path)
     """
-    # Validate file existence
-    if not os.path.exists(file_path):
-        raise FileNotFoundError(f"JSON file not found: {file_path}")
-
     try:
-        with open(file_path, 'r', encoding='utf-8-sig') as file:
-            data = json.load(file)
-            print(f"JSON file '{file_path}' loaded successfully!\n")
-            return data
+        with open(file_path, 'rb') as file:
+            # Strip a UTF-8 BOM if present (equivalent to the 'utf-8-sig' codec)
+            raw = file.read().removeprefix(b'\xef\xbb\xbf')
+        data = _loads_json(raw)
+        logger.debug("JSON file '%s' loaded successfully!", file_path)
+        return data
     except json.JSONDecodeError as exc:
-        raise json.JSONDecodeError(f"Failed to load JSON file '{file_path}': {exc}")
+        raise json.JSONDecodeError(
+            f"Failed to load JSON file '{file_path}': {exc.msg}", exc.doc, exc.pos
+        ) from exc
+    except FileNotFoundError:
+        raise FileNotFoundError(f"JSON file not found: {file_path}") from None
     except Exception as exc:
         raise Exception(f"Failed to load JSON file '{file_path}': {exc}")
 
 
+def _iter_newline_masks(buffer):
+    """
+    Yields the start offset of each chunk of the buffer along with a boolean mask marking its
+    newline bytes, so only one chunk is ever held in memory.
+    """
+    for start in range(0, len(buffer), _CHUNK_SIZE):
+        count = min(_CHUNK_SIZE, len(buffer) - start)
+        yield start, np.frombuffer(buffer, dtype=np.uint8, count=count, offset=start) == 0x0A
+
+
+def _count_lines(buffer):
+    """
+    Returns the number of lines in a CSV buffer, counting a final line without a trailing
+    newline.
+    """
+    number_of_newlines = sum(np.count_nonzero(mask) for _, mask in _iter_newline_masks(buffer))
+    return number_of_newlines + (buffer[-1:] != b'\n')
+
+
+def _line_end_offsets(buffer, line_numbers):
+    """
+    Returns the byte offset just past the end of each of the given 1-based line numbers, which
+    must be sorted. Lines past the last newline end at the end of the buffer.
+
+    Only the newlines of the chunks containing a requested line are located, so memory stays
+    proportional to the chunk size and the number of requested lines, not to the row count.
+    """
+    line_numbers = np.asarray(line_numbers, dtype=np.int64)
+    offsets = np.full(len(line_numbers), len(buffer), dtype=np.int64)
+    found = 0
+    newlines_seen = 0
+    for start, mask in _iter_newline_masks(buffer):
+        if found == len(line_numbers):
+            break
+        newlines_in_chunk = np.count_nonzero(mask)
+        # Requested lines whose terminating newline falls within this chunk
+        end = np.searchsorted(line_numbers, newlines_seen + newlines_in_chunk, side='right')
+        if end > found:
+            positions = np.flatnonzero(mask)
+            offsets[found:end] = positions[line_numbers[found:end] - newlines_seen - 1] + start + 1
+            found = end
+        newlines_seen += newlines_in_chunk
+    return offsets
+
+
+def _open_input_file(input_file):
+    """
+    Opens an input file for binary reading, relying on open() rather than a prior existence
+    check to report a missing file.
+    """
+    try:
+        return open(input_file, 'rb')
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Input file not found: {input_file}") from None
+
+
+def _write_csv_part(output_file, header, buffer, start, end):
+    """
+    Writes the header followed by ``buffer[start:end]`` to the output file, copying the range
+    in chunks rather than slicing it into memory.
+    """
+    with open(output_file, 'wb', buffering=_WRITE_BUFFER_SIZE) as output:
+        output.write(header)
+        with memoryview(buffer) as view:
+            for offset in range(start, end, _CHUNK_SIZE):
+                with view[offset:min(offset + _CHUNK_SIZE, end)] as chunk:
+                    output.write(chunk)
+
+
 def split_csv_into_multiple_csv(input_file, number_of_output_files):
     """
-    Splits a CSV file into multiple separate CSV files based on the specified number of output files.
+    Splits a CSV file into multiple separate CSV files based on the specified number of output
+    files.
+
+    Rows are copied byte-for-byte without being parsed, so quoted fields must not contain
+    embedded newlines.
 
     Parameters:
         input_file (str): The path to the input CSV file.
@@ -88,75 +259,248 @@ def split_csv_into_multiple_csv(input_file, number_of_output_files):
 
     Raises:
         FileNotFoundError: If the input file does not exist.
+        ValueError: If the input file is empty.
 
     Example:
         input_file = 'data.csv'
         number_of_output_files = 3
         split_csv_into_multiple_csv(input_file, number_of_output_files)
     """
-    # Validate input file existence
-    if not os.path.exists(input_file):
-        raise FileNotFoundError(f"Input file not found: {input_file}")
-
-    # Read the input CSV file
-    df = pd.read_csv(input_file)
-
-    # Calculate the split indexes
-    split_indexes = np.int64(np.linspace(0, 1, number_of_output_files+1) * len(df))
-
     output_file_name, *file_format = input_file.split(".")
     file_format = file_format[-1] if file_format else ''
 
-    # Splitting the DataFrame into separate CSV files
-    for i, (start_idx, end_idx) in enumerate(zip(split_indexes, split_indexes[1:]), start=1):
-        temp_df = df[start_idx:end_idx]
-        temp_df.to_csv(f"{output_file_name}_{i}.{file_format}", index=False)
-        print(f"{output_file_name}_{i}.{file_format} saved..")
+    with _open_input_file(input_file) as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            raise ValueError(f"Input file is empty: {input_file}")
+
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # Calculate the split offsets; line 1 is the header, so row i ends at line i + 1
+            number_of_rows = _count_lines(mm) - 1
+            split_indexes = np.int64(np.linspace(0, 1, number_of_output_files+1) * number_of_rows)
+            split_offsets = _line_end_offsets(mm, split_indexes + 1)
+            header = mm[:split_offsets[0]]
+
+            output_files = [
+                f"{output_file_name}_{i}.{file_format}" for i in range(1, number_of_output_files+1)
+            ]
+
+            # Copying each byte range, preceded by the header, into separate CSV files concurrently
+            with ThreadPoolExecutor() as executor:
+                futures = [
+                    executor.submit(_write_csv_part, output_file, header, mm, start, end)
+                    for output_file, start, end in zip(
+                        output_files, split_offsets, split_offsets[1:]
+                    )
+                ]
+                for output_file, future in zip(output_files, futures):
+                    future.result()
+                    logger.debug("%s saved.", output_file)
+
+
+def _arrow_column_types(dtype):
+    """
+    Converts a column to dtype mapping, as accepted by pandas, into pyarrow column types.
+
+    Returns the pyarrow column types, and the pandas extension dtypes (e.g. 'Int64',
+    'category') to apply with astype() once the table is converted to a DataFrame.
+    """
+    column_types = {}
+    extension_dtypes = {}
+    for column, column_type in dtype.items():
+        if isinstance(column_type, pa.DataType):
+            column_types[column] = column_type
+            continue
+
+        column_type = pd.api.types.pandas_dtype(column_type)
+        if pd.api.types.is_object_dtype(column_type):
+            # As with pd.read_csv, object keeps the raw text (e.g. leading zeros in IDs)
+            column_types[column] = pa.string()
+        elif isinstance(column_type, pd.api.extensions.ExtensionDtype):
+            extension_dtypes[column] = column_type
+            if pd.api.types.is_string_dtype(column_type):
+                column_types[column] = pa.string()
+            elif getattr(column_type, 'numpy_dtype', None) is not None:
+                # Nullable numeric/boolean dtypes parse as their numpy counterpart
+                column_types[column] = pa.from_numpy_dtype(column_type.numpy_dtype)
+        else:
+            column_types[column] = pa.from_numpy_dtype(column_type)
+    return column_types, extension_dtypes
+
+
+def _apply_extension_dtypes(df, extension_dtypes):
+    """
+    Casts the columns of df that have a requested pandas extension dtype.
+    """
+    extension_dtypes = {
+        column: column_type for column, column_type in extension_dtypes.items() if column in df
+    }
+    return df.astype(extension_dtypes) if extension_dtypes else df
 
 
-def read_multiple_csv(files):
+def _read_csv(file, engine, read_options):
+    try:
+        if engine == 'pandas':
+            return pd.read_csv(file, **read_options)
+        if isinstance(file, os.PathLike):
+            file = os.fspath(file)
+        if not isinstance(file, str) or file.endswith(_COMPRESSED_SUFFIXES):
+            # Let pyarrow open the source itself, so it picks the codec from the file extension
+            return pacsv.read_csv(file, **read_options)
+        # Memory-map the file so the parser reads pages in place instead of copying blocks
+        with pa.memory_map(file) as source:
+            return pacsv.read_csv(source, **read_options)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"File not found: {file}") from None
+
+
+def read_multiple_csv(files, return_type='pandas', dtype=None, engine=None, executor='thread'):
     """
-    Reads multiple CSV files and combines them into a single DataFrame.
+    Reads multiple CSV files and combines them into a single table.
+
+    With engine='pyarrow', files are parsed in parallel threads by pyarrow and concatenated
+    without copying. Values then differ from pd.read_csv in a few ways: ISO dates and
+    timestamps are parsed into date/datetime values instead of being kept as strings, and
+    missing values in boolean or entirely empty columns become None instead of NaN.
 
     Parameters:
         files (list): A list of file paths to the CSV files.
+        return_type (str, optional): The type of table to return, one of 'pandas', 'arrow' or
+            'polars' (default: 'pandas'). 'arrow' and 'polars' require pyarrow and skip the
+            conversion to a pandas DataFrame.
+        dtype (dict, optional): A mapping of column names to dtypes, applied to every file
+            instead of inferring the types of those columns per file (default: None). Values
+            may be numpy or pandas dtypes, including extension dtypes such as 'Int64' or
+            'category', or pyarrow types with engine='pyarrow'. With engine='pyarrow', extension
+            dtypes without an Arrow equivalent (e.g. 'category') are applied after parsing, and
+            only when return_type is 'pandas'.
+        engine (str, optional): The CSV parser to use, 'pandas' or 'pyarrow' (default: None,
+            meaning 'pandas' for return_type='pandas' and 'pyarrow' otherwise).
+        executor (str, optional): How files are read concurrently, 'thread' or 'process'
+            (default: 'thread'). 'process' can speed up the pandas engine on large files, whose
+            type inference holds the GIL, but the calling script must be guarded by
+            ``if __name__ == '__main__':`` where processes are spawned (e.g. macOS, Windows).
 
     Returns:
-        pandas.DataFrame: A DataFrame containing the combined data from all CSV files.
+        pandas.DataFrame | pyarrow.Table | polars.DataFrame: The combined data from all CSV
+            files, of the requested return_type.
 
     Raises:
         FileNotFoundError: If a file in the list does not exist.
+        ValueError: If the return_type, engine or executor is not supported, or return_type is
+            'arrow' or 'polars' with engine='pandas'.
+        ImportError: If pyarrow is required and not installed, or return_type is 'polars' and
+            polars is not installed.
+        pyarrow.ArrowTypeError: If return_type is 'arrow' or 'polars' and a column has types
+            across files that Arrow cannot unify (e.g. int64 and string).
 
     Example:
         files = ['data1.csv', 'data2.csv', 'data3.csv']
         combined_data = read_multiple_csv(files)
-    """
-    df_list = []
-
-    def _read_csv(file):
-        if not os.path.exists(file):
-            raise FileNotFoundError(f"File not found: {file}")
-        return pd.read_csv(file)
+        combined_data = read_multiple_csv(files, engine='pyarrow')
+        combined_table = read_multiple_csv(files, return_type='arrow')
 
-    with ThreadPoolExecutor() as executor:
+        # Infer the column types from the first file once and reuse them for the rest
+        dtype = read_multiple_csv(files[:1]).dtypes.to_dict()
+        combined_data = read_multiple_csv(files, dtype=dtype)
+    """
+    # Validate return_type parameter
+    if return_type not in ('pandas', 'arrow', 'polars'):
+        raise ValueError("The return_type parameter must be 'pandas', 'arrow' or 'polars'.")
+
+    # Validate engine parameter
+    if engine is None:
+        engine = 'pandas' if return_type == 'pandas' else 'pyarrow'
+    if engine not in ('pandas', 'pyarrow'):
+        raise ValueError("The engine parameter must be 'pandas' or 'pyarrow'.")
+    if return_type != 'pandas' and engine != 'pyarrow':
+        raise ValueError(f"return_type='{return_type}' requires engine='pyarrow'.")
+    if engine == 'pyarrow' and pa is None:
+        raise ImportError("pyarrow is required for engine='pyarrow'.")
+    if return_type == 'polars':
+        try:
+            import polars as pl
+        except ImportError:
+            raise ImportError("polars is required for return_type='polars'.") from None
+
+    # Validate executor parameter
+    if executor not in ('thread', 'process'):
+        raise ValueError("The executor parameter must be 'thread' or 'process'.")
+    # Threads by default: worker processes need a __main__ guard where they are spawned, and
+    # pickle every parsed file back to the parent
+    executor_class = ThreadPoolExecutor if executor == 'thread' else ProcessPoolExecutor
+
+    # Build the parser options once and share them across all files
+    extension_dtypes = {}
+    if engine == 'pandas':
+        read_options = {'dtype': dtype} if dtype is not None else {}
+    else:
+        column_types = None
+        if dtype is not None:
+            column_types, extension_dtypes = _arrow_column_types(dtype)
+        # Treat the same strings as missing as pd.read_csv does, including in string columns
+        convert_options = pacsv.ConvertOptions(
+            column_types=column_types,
+            null_values=_CSV_NULL_VALUES,
+            strings_can_be_null=True,
+        )
+        read_options = {'convert_options': convert_options}
+
+    with executor_class() as pool:
         # Submit tasks to read CSV files concurrently
-        futures = [executor.submit(_read_csv, file) for file in files]
-
-        # Process results as they become available
-        for future in futures:
-            df = future.result()
-            if len(df):
-                df_list.append(df)
-
-    # Concatenate the DataFrames
-    combined_df = pd.concat(df_list, ignore_index=True)
-    return combined_df
+        futures = {
+            pool.submit(_read_csv, file, engine, read_options): index
+            for index, file in enumerate(files)
+        }
+
+        # Collect results as they finish, keeping the input file order; on the first failure,
+        # cancel the files still queued instead of waiting for them to be parsed
+        results = [None] * len(files)
+        try:
+            for future in as_completed(futures):
+                results[futures.pop(future)] = future.result()
+        except BaseException:
+            pool.shutdown(cancel_futures=True)
+            raise
+
+    if engine == 'pandas':
+        # Concatenate the DataFrames; pd.concat falls back to object for categorical columns
+        # whose categories differ between files, so the requested dtypes are applied again
+        combined_df = pd.concat([df for df in results if len(df)], ignore_index=True)
+        categorical_dtypes = {
+            column: column_type for column, column_type in (dtype or {}).items()
+            if isinstance(pd.api.types.pandas_dtype(column_type), pd.CategoricalDtype)
+        }
+        return _apply_extension_dtypes(combined_df, categorical_dtypes)
+
+    # Concatenate the Arrow tables without copying, then build the DataFrame block by block
+    tables = [table for table in results if table.num_rows > 0]
+    if not tables:
+        raise ValueError("No objects to concatenate")
+    try:
+        # Permissive promotion widens e.g. int64 and double columns to a common type
+        combined_table = pa.concat_tables(tables, promote_options="permissive")
+    except (pa.ArrowTypeError, pa.ArrowInvalid):
+        if return_type != 'pandas':
+            raise
+        # Types Arrow cannot unify (e.g. int64 and string) become object columns in pandas
+        combined_df = pd.concat([table.to_pandas() for table in tables], ignore_index=True)
+        return _apply_extension_dtypes(combined_df, extension_dtypes)
+
+    if return_type == 'arrow':
+        return combined_table
+    if return_type == 'polars':
+        return pl.from_arrow(combined_table)
+    combined_df = combined_table.to_pandas(split_blocks=True, self_destruct=True)
+    return _apply_extension_dtypes(combined_df, extension_dtypes)
 
 
 def split_csv_by_ratio_into_two_csv(input_file, output_file1, output_file2, split_ratio=0.5):
     """
     Splits a CSV file into two separate CSV files based on a split ratio.
 
+    Rows are copied byte-for-byte without being parsed, so quoted fields must not contain
+    embedded newlines.
+
     Parameters:
         input_file (str): The path to the input CSV file.
         output_file1 (str): The path to the first output CSV file.
@@ -168,7 +512,8 @@ def split_csv_by_ratio_into_two_csv(input_file, output_file1, output_file2, spli
 
     Raises:
         FileNotFoundError: If the input file does not exist.
-        ValueError: If the split ratio is not within the valid range of 0 to 1.
+        ValueError: If the split ratio is not within the valid range of 0 to 1, or the
+            input file is empty.
 
     Example:
         input_file = 'data.csv'
@@ -176,27 +521,23 @@ def split_csv_by_ratio_into_two_csv(input_file, output_file1, output_file2, spli
         output_file2 = 'split2.csv'
         split_csv_by_ratio_into_two_csv(input_file, output_file1, output_file2, split_ratio=0.5)
     """
-    
-    # Validate input file existence
-    if not os.path.exists(input_file):
-        raise FileNotFoundError(f"Input file not found: {input_file}")
-    
+
     # Validate split ratio
     if not 0 <= split_ratio <= 1:
         raise ValueError("Split ratio must be between 0 and 1.")
 
-    # Read the input CSV file
-    df = pd.read_csv(input_file)
-    
-    # Calculate the split index
-    split_index = int(len(df) * split_ratio)
-    
-    # Split the DataFrame into two parts
-    df1 = df[:split_index]
-    df2 = df[split_index:]
-    
-    # Write the split DataFrames to separate CSV files
-    df1.to_csv(output_file1, index=False)
-    df2.to_csv(output_file2, index=False)
-    
-    print("Splitting complete!")
+    with _open_input_file(input_file) as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            raise ValueError(f"Input file is empty: {input_file}")
+
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # Calculate the split offset; line 1 is the header, so row i ends at line i + 1
+            split_index = int((_count_lines(mm) - 1) * split_ratio)
+            header_offset, split_offset = _line_end_offsets(mm, [1, split_index + 1])
+            header = mm[:header_offset]
+
+            # Write the two byte ranges, each preceded by the header, to separate CSV files
+            _write_csv_part(output_file1, header, mm, header_offset, split_offset)
+            _write_csv_part(output_file2, header, mm, split_offset, len(mm))
+
+    logger.debug("Splitting complete!")
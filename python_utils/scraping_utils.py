@@ -1,3 +1,57 @@
+from functools import lru_cache
+import logging
+
+try:
+    from lxml import etree
+except ImportError:
+    etree = None
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=512)
+def _compile_xpath(xpath, namespaces):
+    """
+    Compiles an XPath expression once per (expression, namespaces) pair.
+    """
+    return etree.XPath(xpath, namespaces=dict(namespaces), smart_strings=False)
+
+
+def _serialize_xpath_result(node, method):
+    """
+    Converts a single XPath result to a string the way Scrapy's Selector.extract() does.
+    """
+    if isinstance(node, str):
+        return node
+    if isinstance(node, bool):
+        return '1' if node else '0'
+    try:
+        return etree.tostring(node, method=method, encoding='unicode', with_tail=False)
+    except TypeError:
+        return str(node)
+
+
+def _extract_xpath(response, xpath):
+    """
+    Evaluates an XPath expression against a response and returns the results as strings.
+
+    Responses backed by an lxml tree (e.g. Scrapy responses) are evaluated with a cached,
+    compiled XPath; anything else falls back to response.xpath(xpath).extract().
+    """
+    selector = getattr(response, 'selector', None)
+    root = getattr(selector, 'root', None)
+    if etree is None or not isinstance(root, etree._Element):
+        return response.xpath(xpath).extract()
+
+    namespaces = tuple(sorted(getattr(selector, 'namespaces', {}).items()))
+    result = _compile_xpath(xpath, namespaces)(root)
+    if not isinstance(result, list):
+        result = [result]
+
+    method = 'xml' if getattr(selector, 'type', None) == 'xml' else 'html'
+    return [_serialize_xpath_result(node, method) for node in result]
+
+
 def scrape_xpath(response, xpath):
     """
     Scrapes data from a web response using the provided XPath expression.
@@ -21,13 +75,32 @@ def scrape_xpath(response, xpath):
     if not xpath or not isinstance(xpath, str):
         raise ValueError("Invalid xpath.")
 
+    data = None
     try:
-        data = response.xpath(xpath).extract()
+        data = _extract_xpath(response, xpath) or None
     except Exception as exc:
-        print(f"!! Exception encountered while scraping xpath: {xpath} !!\n", exc)
-        return None
+        logger.warning("Exception encountered while scraping xpath %s: %s", xpath, exc)
+
+    return data
 
-    return data if data else None
+
+def _iter_full_urls(root_url, urls):
+    """
+    Validates the parameters of get_full_urls and returns an iterator over the full URLs.
+    """
+    # Validate root_url parameter
+    if not isinstance(root_url, str):
+        raise ValueError("The root_url parameter must be a string.")
+
+    # Validate urls parameter
+    if not isinstance(urls, list):
+        raise ValueError("The urls parameter must be a list.")
+
+    # Normalize root_url once so it ends with exactly one forward slash
+    root_url = root_url.rstrip('/') + '/'
+
+    # Generate full URLs by concatenating root_url and relative URLs, stripping each URL once
+    return (root_url + path for url in urls if (path := url.strip('/')))
 
 
 def get_full_urls(root_url, urls):
@@ -49,20 +122,7 @@ def get_full_urls(root_url, urls):
         urls = ['page1.html', 'page2.html', 'page3.html']
         full_urls = get_full_urls(root_url, urls)
     """
-    # Validate root_url parameter
-    if not isinstance(root_url, str):
-        raise ValueError("The root_url parameter must be a string.")
-
-    # Validate urls parameter
-    if not isinstance(urls, list):
-        raise ValueError("The urls parameter must be a list.")
-
-    # Ensure root_url ends with a forward slash
-    if not root_url.endswith('/'):
-        root_url += '/'
-
-    # Generate full URLs by concatenating root_url and relative URLs
-    return [root_url + url.strip('/') for url in urls if url.strip('/')]
+    return list(_iter_full_urls(root_url, urls))
 
 
 def extract_urls_from_xpath(response, xpath, root_url):
@@ -87,4 +147,5 @@ def extract_urls_from_xpath(response, xpath, root_url):
         urls = extract_urls_from_xpath(response, xpath, root_url)
     """
     urls = scrape_xpath(response, xpath)
-    return set(get_full_urls(root_url, urls)) if urls else None
+    # Build the set directly rather than de-duplicating an intermediate list
+    return set(_iter_full_urls(root_url, urls)) if urls else None
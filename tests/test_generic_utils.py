@@ -0,0 +1,409 @@
+import gzip
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from python_utils import generic_utils
+from python_utils.generic_utils import (
+    load_json_file,
+    read_multiple_csv,
+    save_output_in_json,
+    split_csv_by_ratio_into_two_csv,
+    split_csv_into_multiple_csv,
+)
+
+
+def _make_csv(number_of_rows):
+    return "a,b\n" + "".join(f"{i},{i * 2}\n" for i in range(number_of_rows))
+
+
+def _expected_splits(csv_file, number_of_output_files):
+    """Row split produced by the original pd.read_csv / to_csv implementation."""
+    df = pd.read_csv(csv_file)
+    split_indexes = np.int64(np.linspace(0, 1, number_of_output_files + 1) * len(df))
+    return [df[start:end] for start, end in zip(split_indexes, split_indexes[1:])]
+
+
+@pytest.mark.parametrize("number_of_rows", [1, 10, 97])
+@pytest.mark.parametrize("number_of_output_files", [1, 3, 7])
+def test_split_csv_into_multiple_csv_matches_pandas_split(
+    tmp_path, monkeypatch, number_of_rows, number_of_output_files
+):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "data.csv").write_text(_make_csv(number_of_rows))
+
+    split_csv_into_multiple_csv("data.csv", number_of_output_files)
+
+    expected = _expected_splits("data.csv", number_of_output_files)
+    for i, expected_df in enumerate(expected, start=1):
+        actual_df = pd.read_csv(f"data_{i}.csv")
+        # Compare values rather than frames: an empty part reads back with object dtypes
+        assert list(actual_df.columns) == list(expected_df.columns)
+        assert actual_df.values.tolist() == expected_df.values.tolist()
+
+
+def test_split_csv_into_multiple_csv_preserves_bytes(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    content = _make_csv(10)
+    (tmp_path / "data.csv").write_text(content)
+
+    split_csv_into_multiple_csv("data.csv", 3)
+
+    parts = [(tmp_path / f"data_{i}.csv").read_text() for i in range(1, 4)]
+    assert all(part.startswith("a,b\n") for part in parts)
+    assert "a,b\n" + "".join(part[len("a,b\n"):] for part in parts) == content
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 64])
+def test_split_csv_into_multiple_csv_small_chunks(tmp_path, monkeypatch, chunk_size):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(generic_utils, "_CHUNK_SIZE", chunk_size)
+    content = _make_csv(23)
+    (tmp_path / "data.csv").write_text(content)
+
+    split_csv_into_multiple_csv("data.csv", 4)
+
+    expected = _expected_splits("data.csv", 4)
+    for i, expected_df in enumerate(expected, start=1):
+        assert pd.read_csv(f"data_{i}.csv").values.tolist() == expected_df.values.tolist()
+
+
+def test_split_csv_into_multiple_csv_last_row_without_newline(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "data.csv").write_text("a,b\n1,2\n3,4\n5,6")
+
+    split_csv_into_multiple_csv("data.csv", 2)
+
+    assert (tmp_path / "data_1.csv").read_text() == "a,b\n1,2\n"
+    assert (tmp_path / "data_2.csv").read_text() == "a,b\n3,4\n5,6"
+
+
+def test_split_csv_into_multiple_csv_header_only(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "data.csv").write_text("a,b\n")
+
+    split_csv_into_multiple_csv("data.csv", 3)
+
+    for i in range(1, 4):
+        assert (tmp_path / f"data_{i}.csv").read_text() == "a,b\n"
+
+
+def test_split_csv_into_multiple_csv_empty_file(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "data.csv").write_text("")
+
+    with pytest.raises(ValueError):
+        split_csv_into_multiple_csv("data.csv", 2)
+
+
+def test_split_csv_into_multiple_csv_more_files_than_rows(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "data.csv").write_text(_make_csv(2))
+
+    split_csv_into_multiple_csv("data.csv", 5)
+
+    expected = _expected_splits("data.csv", 5)
+    row_counts = [len(pd.read_csv(f"data_{i}.csv")) for i in range(1, 6)]
+    assert row_counts == [len(df) for df in expected]
+    assert sum(row_counts) == 2
+
+
+def test_split_csv_into_multiple_csv_missing_file(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    with pytest.raises(FileNotFoundError):
+        split_csv_into_multiple_csv("missing.csv", 2)
+
+
+@pytest.mark.parametrize("number_of_rows", [0, 1, 10])
+@pytest.mark.parametrize("split_ratio", [0, 0.3, 0.5, 1])
+def test_split_csv_by_ratio_into_two_csv_matches_pandas_split(
+    tmp_path, number_of_rows, split_ratio
+):
+    input_file = tmp_path / "data.csv"
+    output_file1, output_file2 = tmp_path / "split1.csv", tmp_path / "split2.csv"
+    input_file.write_text(_make_csv(number_of_rows))
+
+    split_csv_by_ratio_into_two_csv(input_file, output_file1, output_file2, split_ratio)
+
+    # Row split produced by the original pd.read_csv / to_csv implementation
+    df = pd.read_csv(input_file)
+    split_index = int(len(df) * split_ratio)
+    expected = [(output_file1, df[:split_index]), (output_file2, df[split_index:])]
+    for output_file, expected_df in expected:
+        actual_df = pd.read_csv(output_file)
+        assert list(actual_df.columns) == list(expected_df.columns)
+        assert actual_df.values.tolist() == expected_df.values.tolist()
+
+
+@pytest.mark.parametrize("chunk_size", [1, 5, 64])
+def test_split_csv_by_ratio_into_two_csv_small_chunks(tmp_path, monkeypatch, chunk_size):
+    monkeypatch.setattr(generic_utils, "_CHUNK_SIZE", chunk_size)
+    input_file = tmp_path / "data.csv"
+    output_file1, output_file2 = tmp_path / "split1.csv", tmp_path / "split2.csv"
+    input_file.write_text(_make_csv(23))
+
+    split_csv_by_ratio_into_two_csv(input_file, output_file1, output_file2, 0.4)
+
+    assert pd.read_csv(output_file1)["a"].tolist() == list(range(9))
+    assert pd.read_csv(output_file2)["a"].tolist() == list(range(9, 23))
+
+
+def test_split_csv_by_ratio_into_two_csv_last_row_without_newline(tmp_path):
+    input_file = tmp_path / "data.csv"
+    output_file1, output_file2 = tmp_path / "split1.csv", tmp_path / "split2.csv"
+    input_file.write_text("a,b\n1,2\n3,4\n5,6")
+
+    split_csv_by_ratio_into_two_csv(input_file, output_file1, output_file2, 0.5)
+
+    assert output_file1.read_text() == "a,b\n1,2\n"
+    assert output_file2.read_text() == "a,b\n3,4\n5,6"
+
+
+def test_split_csv_by_ratio_into_two_csv_header_only(tmp_path):
+    input_file = tmp_path / "data.csv"
+    output_file1, output_file2 = tmp_path / "split1.csv", tmp_path / "split2.csv"
+    input_file.write_text("a,b\n")
+
+    split_csv_by_ratio_into_two_csv(input_file, output_file1, output_file2)
+
+    assert output_file1.read_text() == "a,b\n"
+    assert output_file2.read_text() == "a,b\n"
+
+
+def test_split_csv_by_ratio_into_two_csv_empty_file(tmp_path):
+    input_file = tmp_path / "data.csv"
+    input_file.write_text("")
+
+    with pytest.raises(ValueError):
+        split_csv_by_ratio_into_two_csv(
+            input_file, tmp_path / "split1.csv", tmp_path / "split2.csv"
+        )
+
+
+@pytest.mark.parametrize("split_ratio", [-0.1, 1.5])
+def test_split_csv_by_ratio_into_two_csv_invalid_ratio(tmp_path, split_ratio):
+    input_file = tmp_path / "data.csv"
+    input_file.write_text(_make_csv(2))
+
+    with pytest.raises(ValueError):
+        split_csv_by_ratio_into_two_csv(
+            input_file, tmp_path / "split1.csv", tmp_path / "split2.csv", split_ratio
+        )
+
+
+def test_split_csv_by_ratio_into_two_csv_missing_file(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        split_csv_by_ratio_into_two_csv(
+            tmp_path / "missing.csv", tmp_path / "split1.csv", tmp_path / "split2.csv"
+        )
+
+
+@pytest.fixture(params=["orjson", "ujson", "json"])
+def json_backend(request, monkeypatch):
+    """Forces generic_utils onto one JSON backend by hiding the preferred ones."""
+    if request.param != "json":
+        pytest.importorskip(request.param)
+    if request.param != "orjson":
+        monkeypatch.setattr(generic_utils, "orjson", None)
+    if request.param == "json":
+        monkeypatch.setattr(generic_utils, "ujson", None)
+    return request.param
+
+
+JSON_DATA = {"b": 1, "a": [1.5, "é/x", None, True], "c": {"nested": "value"}}
+
+
+@pytest.mark.parametrize("pretty", [False, True])
+def test_save_output_in_json_round_trip(tmp_path, json_backend, pretty):
+    output_file = tmp_path / "output.json"
+
+    save_output_in_json(output_file, JSON_DATA, data_description="my_data", pretty=pretty)
+
+    assert load_json_file(output_file) == {"my_data": JSON_DATA}
+
+
+@pytest.mark.parametrize("pretty", [False, True])
+def test_save_output_in_json_matches_stdlib_layout(tmp_path, json_backend, pretty):
+    output_file = tmp_path / "output.json"
+
+    save_output_in_json(output_file, JSON_DATA, pretty=pretty)
+
+    if pretty:
+        expected = json.dumps({"data": JSON_DATA}, ensure_ascii=False, indent=2, sort_keys=True)
+    else:
+        expected = json.dumps({"data": JSON_DATA}, ensure_ascii=False, separators=(",", ":"))
+    assert output_file.read_text(encoding="utf8") == expected
+
+
+@pytest.mark.parametrize("wide_integer", [2**70 + 3, -(2**63) - 1])
+def test_save_output_in_json_wide_integer(tmp_path, json_backend, wide_integer):
+    output_file = tmp_path / "output.json"
+
+    save_output_in_json(output_file, [wide_integer, 1.5])
+
+    data = load_json_file(output_file)
+    assert data == {"data": [wide_integer, 1.5]}
+    assert isinstance(data["data"][0], int)
+
+
+def test_load_json_file_strips_bom(tmp_path, json_backend):
+    input_file = tmp_path / "input.json"
+    input_file.write_bytes(b'\xef\xbb\xbf{"a": 1}')
+
+    assert load_json_file(input_file) == {"a": 1}
+
+
+def test_load_json_file_invalid_json(tmp_path, json_backend):
+    input_file = tmp_path / "input.json"
+    input_file.write_text("{bad")
+
+    with pytest.raises(json.JSONDecodeError):
+        load_json_file(input_file)
+
+
+def test_load_json_file_missing_file(tmp_path, json_backend):
+    with pytest.raises(FileNotFoundError):
+        load_json_file(tmp_path / "missing.json")
+
+
+def _write_csv_files(tmp_path, contents):
+    files = []
+    for i, content in enumerate(contents):
+        csv_file = tmp_path / f"data{i}.csv"
+        csv_file.write_text(content)
+        files.append(str(csv_file))
+    return files
+
+
+def test_read_multiple_csv_uses_threads_by_default(tmp_path, monkeypatch):
+    files = _write_csv_files(tmp_path, [_make_csv(3), _make_csv(2)])
+    monkeypatch.setattr(generic_utils, "ProcessPoolExecutor", None)
+
+    df = read_multiple_csv(files)
+
+    assert df["a"].tolist() == [0, 1, 2, 0, 1]
+
+
+def test_read_multiple_csv_process_executor(tmp_path):
+    files = _write_csv_files(tmp_path, [_make_csv(3), _make_csv(2)])
+
+    df = read_multiple_csv(files, executor="process")
+
+    assert df["a"].tolist() == [0, 1, 2, 0, 1]
+
+
+def test_read_multiple_csv_invalid_executor(tmp_path):
+    files = _write_csv_files(tmp_path, [_make_csv(1)])
+
+    with pytest.raises(ValueError):
+        read_multiple_csv(files, executor="fiber")
+
+
+@pytest.mark.parametrize("engine", ["pandas", "pyarrow"])
+def test_read_multiple_csv_path_and_compressed_files(tmp_path, engine):
+    if engine == "pyarrow":
+        pytest.importorskip("pyarrow")
+    plain_file = tmp_path / "plain.csv"
+    plain_file.write_text(_make_csv(2))
+    compressed_file = tmp_path / "compressed.csv.gz"
+    compressed_file.write_bytes(gzip.compress(_make_csv(3).encode()))
+
+    df = read_multiple_csv([plain_file, str(compressed_file), compressed_file], engine=engine)
+
+    assert df["a"].tolist() == [0, 1, 0, 1, 2, 0, 1, 2]
+
+
+@pytest.mark.parametrize("engine", ["pandas", "pyarrow"])
+@pytest.mark.parametrize("text_dtype", [object, str])
+def test_read_multiple_csv_text_dtype_keeps_raw_text(tmp_path, engine, text_dtype):
+    if engine == "pyarrow":
+        pytest.importorskip("pyarrow")
+    files = _write_csv_files(tmp_path, ["zip,n\n01234,1\n00007,2\n", "zip,n\n05555,3\n"])
+
+    df = read_multiple_csv(files, dtype={"zip": text_dtype}, engine=engine)
+
+    assert df["zip"].tolist() == ["01234", "00007", "05555"]
+    assert df["n"].tolist() == [1, 2, 3]
+
+
+@pytest.fixture(params=["pandas", "pyarrow"])
+def csv_engine(request):
+    if request.param == "pyarrow":
+        pytest.importorskip("pyarrow")
+    return request.param
+
+
+def _expected_concat(files, **kwargs):
+    return pd.concat([pd.read_csv(file, **kwargs) for file in files], ignore_index=True)
+
+
+def test_read_multiple_csv_matches_pandas_concat(tmp_path, csv_engine):
+    files = _write_csv_files(
+        tmp_path,
+        ["id,price,name\n1,2.5,apple\n2,,pear\n", "id,price,name\n3,4.0,\n4,1.25,fig\n"],
+    )
+
+    df = read_multiple_csv(files, engine=csv_engine)
+
+    pd.testing.assert_frame_equal(df, _expected_concat(files), check_dtype=False)
+    assert df.dtypes["id"].kind == "i"
+    assert df.dtypes["price"].kind == "f"
+
+
+def test_read_multiple_csv_preserves_input_order(tmp_path, csv_engine):
+    # The large first file finishes last, so results arrive out of order under as_completed
+    contents = [_make_csv(20000)] + [f"a,b\n{i},{i}\n" for i in range(1, 9)]
+    files = _write_csv_files(tmp_path, contents)
+
+    df = read_multiple_csv(files, engine=csv_engine)
+
+    assert df["a"].tolist() == list(range(20000)) + list(range(1, 9))
+
+
+def test_read_multiple_csv_int_float_mismatch(tmp_path, csv_engine):
+    files = _write_csv_files(tmp_path, ["a\n1\n2\n", "a\n1.5\n"])
+
+    df = read_multiple_csv(files, engine=csv_engine)
+
+    assert df["a"].tolist() == [1.0, 2.0, 1.5]
+    assert df.dtypes["a"].kind == "f"
+
+
+def test_read_multiple_csv_int_string_mismatch(tmp_path, csv_engine):
+    files = _write_csv_files(tmp_path, ["a\n1\n2\n", "a\nx\n"])
+
+    df = read_multiple_csv(files, engine=csv_engine)
+
+    assert df["a"].tolist() == _expected_concat(files)["a"].tolist() == [1, 2, "x"]
+
+
+def test_read_multiple_csv_skips_empty_files(tmp_path, csv_engine):
+    files = _write_csv_files(tmp_path, ["a,b\n", _make_csv(2), "a,b\n", _make_csv(1)])
+
+    df = read_multiple_csv(files, engine=csv_engine)
+
+    assert df["a"].tolist() == [0, 1, 0]
+    assert df.dtypes["a"].kind == "i"
+
+
+def test_read_multiple_csv_missing_file(tmp_path, csv_engine):
+    files = _write_csv_files(tmp_path, [_make_csv(1)]) + [str(tmp_path / "missing.csv")]
+
+    with pytest.raises(FileNotFoundError):
+        read_multiple_csv(files, engine=csv_engine)
+
+
+def test_read_multiple_csv_dtype(tmp_path, csv_engine):
+    files = _write_csv_files(tmp_path, ["n,c,o\n1,x,007\n,y,8\n", "n,c,o\n3,x,09\n"])
+    dtype = {"n": "Int64", "c": "category", "o": object}
+
+    df = read_multiple_csv(files, dtype=dtype, engine=csv_engine)
+
+    assert str(df.dtypes["n"]) == "Int64"
+    assert df["n"].tolist() == [1, pd.NA, 3]
+    assert isinstance(df.dtypes["c"], pd.CategoricalDtype)
+    assert df["c"].tolist() == ["x", "y", "x"]
+    assert df["o"].tolist() == ["007", "8", "09"]
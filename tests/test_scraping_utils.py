@@ -0,0 +1,97 @@
+from types import SimpleNamespace
+
+import pytest
+
+from python_utils.scraping_utils import extract_urls_from_xpath, get_full_urls, scrape_xpath
+
+HTML = """
+<html>
+  <body>
+    <!-- navigation -->
+    <div class="content main" id="first"><p>One <b>bold</b> tail</p><p>Two</p></div>
+    <div class="sidebar"><a href="/a">A</a><a href="b/">B</a><a href="/a/">A again</a></div>
+  </body>
+</html>
+"""
+
+
+def _response(selector):
+    """Mimics the selector/xpath surface of a Scrapy response."""
+    return SimpleNamespace(selector=selector, xpath=selector.xpath)
+
+
+@pytest.mark.parametrize(
+    "xpath",
+    [
+        "//p",
+        "//p//text()",
+        "//div/@class",
+        "count(//p)",
+        "boolean(//p)",
+        "//comment()",
+        "//div[re:test(@class, '^cont')]/@id",
+        "//div[has-class('sidebar')]/a/@href",
+        "string(//div[@id='first'])",
+        "//table",
+        "//p[",
+    ],
+)
+def test_scrape_xpath_matches_parsel(xpath):
+    parsel = pytest.importorskip("parsel")
+    selector = parsel.Selector(text=HTML)
+
+    try:
+        expected = selector.xpath(xpath).getall() or None
+    except ValueError:
+        expected = None
+
+    assert scrape_xpath(_response(selector), xpath) == expected
+
+
+def test_scrape_xpath_falls_back_to_response_xpath():
+    parsel = pytest.importorskip("parsel")
+    selector = parsel.Selector(text=HTML)
+    response = SimpleNamespace(xpath=selector.xpath)
+
+    assert scrape_xpath(response, "//p/text()") == ["One ", " tail", "Two"]
+
+
+@pytest.mark.parametrize("xpath", ["", None])
+def test_scrape_xpath_invalid_xpath(xpath):
+    with pytest.raises(ValueError):
+        scrape_xpath(SimpleNamespace(), xpath)
+
+
+def test_extract_urls_from_xpath_deduplicates():
+    parsel = pytest.importorskip("parsel")
+    response = _response(parsel.Selector(text=HTML))
+
+    urls = extract_urls_from_xpath(response, "//a/@href", "https://example.com/")
+
+    assert urls == {"https://example.com/a", "https://example.com/b"}
+
+
+def test_extract_urls_from_xpath_no_match():
+    parsel = pytest.importorskip("parsel")
+    response = _response(parsel.Selector(text=HTML))
+
+    assert extract_urls_from_xpath(response, "//table/@href", "https://example.com/") is None
+
+
+@pytest.mark.parametrize(
+    "root_url", ["https://example.com", "https://example.com/", "https://example.com//"]
+)
+def test_get_full_urls_normalizes_root_url(root_url):
+    urls = get_full_urls(root_url, ["page1.html", "/page2.html", "dir/page3/", "/"])
+
+    assert urls == [
+        "https://example.com/page1.html",
+        "https://example.com/page2.html",
+        "https://example.com/dir/page3",
+    ]
+
+
+@pytest.mark.parametrize("root_url, urls", [(None, ["a"]), ("https://example.com", "a")])
+def test_get_full_urls_invalid_arguments(root_url, urls):
+    with pytest.raises(ValueError):
+        get_full_urls(root_url, urls)